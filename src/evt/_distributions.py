@@ -0,0 +1,60 @@
+"""
+Closed-form fits and survival functions of distributions in extreme value theory, shared by the methods and the
+estimators.
+
+The tail index :math:`\\gamma` follows the sign convention of this package, which is the opposite of ``scipy`` for
+the generalized extreme value distribution.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def fit_exponential(
+        x: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Maximum likelihood fit of the exponential distribution to the observations ``x``, which is in closed form.
+    Equivalent to ``scipy.stats.expon.fit(x)``.
+
+    :return: the location and the scale.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    loc = np.min(x)
+    return loc, np.mean(x) - loc
+
+
+def gev_survival_function(
+        x: np.ndarray,
+        tail_index: float,
+        loc: float,
+        scale: float
+) -> np.ndarray:
+    """
+    Returns the survival function of the generalized extreme value distribution at ``x``.
+    Equivalent to ``scipy.stats.genextreme.sf(x, -tail_index, loc, scale)``, without the generic ``rv_continuous``
+    argument handling.
+    """
+    z = (np.asarray(x, dtype=np.float64) - loc) / scale
+    if tail_index == 0:
+        return -np.expm1(-np.exp(-z))
+    with np.errstate(divide='ignore'):  # outside of the support, the survival function is 0 or 1
+        return -np.expm1(-np.power(np.maximum(1 + tail_index * z, 0), -1 / tail_index))
+
+
+def gpd_survival_function(
+        x: np.ndarray,
+        tail_index: float,
+        loc: float,
+        scale: float
+) -> np.ndarray:
+    """
+    Returns the survival function of the generalized Pareto distribution at ``x``.
+    Equivalent to ``scipy.stats.genpareto.sf(x, tail_index, loc, scale)``, without the generic ``rv_continuous``
+    argument handling.
+    """
+    z = np.maximum((np.asarray(x, dtype=np.float64) - loc) / scale, 0)
+    if tail_index == 0:
+        return np.exp(-z)
+    with np.errstate(divide='ignore'):  # outside of the support, the survival function is 0
+        return np.power(np.maximum(1 + tail_index * z, 0), -1 / tail_index)
@@ -14,26 +14,59 @@ class Dataset:
     * The data cannot contain ``nan``,
     * The data cannot contain non-finite values,
     * The data cannot contain duplicate indices.
+
+    The data of ``series`` is not copied. Pass ``series.copy()`` if the original series is modified afterwards.
     """
     def __init__(
             self,
             series: pd.Series,
     ):
-        self.series = self._validate_raw_data(series.copy())
+        values = self._validate_raw_data(series)
+        self.series = series.copy(deep=False)
+        self._values = np.ascontiguousarray(values).view()  # read-only view only
+        self._values.flags.writeable = False
+        self._sorted_values = None
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only C-contiguous ``float64`` ``np.ndarray`` of the values of the dataset, in the original order.
+        Converted once on construction, such that the methods do not convert ``series`` again.
+        """
+        return self._values
+
+    @property
+    def sorted_values(self) -> np.ndarray:
+        """
+        Read-only ``np.ndarray`` of the values of the dataset, sorted in ascending order.
+        Sorted once on first access and reused by the methods that need sorted data.
+        """
+        if self._sorted_values is None:
+            self._sorted_values = np.sort(self._values)
+            self._sorted_values.flags.writeable = False
+        return self._sorted_values
 
     @staticmethod
     def _validate_raw_data(
             series: pd.Series
-    ):
-        if series.isna().any():
-            raise ValueError(
-                f'There are {series.isna().sum()} NaNs in the series.'
-            )
-        if not np.isfinite(series.to_numpy()).all():
-            raise ValueError(f'There are {np.sum(~np.isfinite(series.to_numpy()))} non-finite values in the dataset.')
-        if series.index.duplicated().any():
-            raise ValueError(f'There are {series.index.duplicated().sum()} duplicate indices in the series.')
-        return series
+    ) -> np.ndarray:
+        """
+        Validates ``series`` and returns its values as ``float64``, such that they are converted only once.
+        """
+        if pd.api.types.is_extension_array_dtype(series.dtype):  # nullable dtypes can contain pd.NA
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:  # no copy for float64
+            values = series.to_numpy(dtype=np.float64)
+        is_finite = np.isfinite(values)  # nan is not finite either
+        if not is_finite.all():
+            number_of_nans = np.sum(np.isnan(values))
+            if number_of_nans:
+                raise ValueError(f'There are {number_of_nans} NaNs in the series.')
+            raise ValueError(f'There are {np.sum(~is_finite)} non-finite values in the dataset.')
+        is_duplicated = series.index.duplicated()
+        if is_duplicated.any():
+            raise ValueError(f'There are {is_duplicated.sum()} duplicate indices in the series.')
+        return values
 
     def plot_dataset(
         self,
@@ -59,19 +92,40 @@ class Dataset:
         """
         Boxplot of the dataset.
         """
+        values = self._values
+
         ax2 = ax.twiny()
+        counts, bin_edges = np.histogram(values, bins=40)
         ax.hist(
-            self.series,
-            bins=40,
+            bin_edges[:-1],  # already binned: one weighted value per bin
+            bins=bin_edges,
+            weights=counts,
             orientation='horizontal',
             color='k',
             alpha=.3
         )
-        ax2.boxplot(
-            self.series.values,
-            sym='x',
-            whis=[5, 95],
-            labels=['']
+
+        # same statistics as ax.boxplot(..., whis=[5, 95]), with all quantiles from a single call
+        whisker_low, first_quartile, median, third_quartile, whisker_high = np.percentile(
+            values,
+            [5, 25, 50, 75, 95]
+        )
+        whisker_low = min(first_quartile, np.min(values[values >= whisker_low]))
+        whisker_high = max(third_quartile, np.max(values[values <= whisker_high]))
+        ax2.bxp(
+            [{
+                'label': '',
+                'med': median,
+                'q1': first_quartile,
+                'q3': third_quartile,
+                'whislo': whisker_low,
+                'whishi': whisker_high,
+                'fliers': np.concatenate([
+                    values[values < whisker_low],
+                    values[values > whisker_high],
+                ]),
+            }],
+            flierprops={'marker': 'x'}
         )
         ax.set_xlabel('Number of observations')
         ax.set_ylabel(self.series.name or '')
@@ -86,7 +140,7 @@ class Dataset:
         Plot the empirical mean excess (average excess of a threshold) as a function of the threshold.
         """
         ax.plot(
-            utils.mean_excess(self.series),
+            utils.mean_excess(self.series, self.sorted_values),
             'kx',
             alpha=.8
         )
@@ -104,10 +158,13 @@ class Dataset:
         Cumulative absolute-maximum-to-absolute-sum plot of the dataset for ``number_of_moments`` moments against
         the original index.
         """
-        absolute_series = self.series.abs()
+        absolute_values = np.abs(self._values)
+        powered_values = absolute_values.copy()
         for moment in range(1, number_of_moments + 1):
-            maximum_to_sum = (absolute_series ** moment).cummax() / (absolute_series ** moment).cumsum()
-            ax.plot(maximum_to_sum, '-', label=f'Moment {moment}')
+            if moment > 1:
+                np.multiply(powered_values, absolute_values, out=powered_values)
+            maximum_to_sum = np.maximum.accumulate(powered_values) / np.add.accumulate(powered_values)
+            ax.plot(self.series.index, maximum_to_sum, '-', label=f'Moment {moment}')
         ax.set_ylim(0, 1)
         ax.legend(loc='upper left')
         ax.grid()
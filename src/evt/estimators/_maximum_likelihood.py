@@ -0,0 +1,277 @@
+"""
+Negative log-likelihoods with analytic gradients for the generalized extreme value and generalized Pareto
+distributions, and a small quasi-Newton minimizer to fit them.
+
+Fitting with ``scipy.stats`` evaluates the negative log-likelihood through the generic ``rv_continuous`` machinery
+on every iteration of a derivative-free optimizer. The expressions below are plain vectorized ``numpy``, and the
+analytic gradients allow for a quasi-Newton method that converges in far fewer iterations.
+
+The tail index :math:`\\gamma` follows the sign convention of this package, which is the opposite of ``scipy``.
+"""
+from typing import Callable, Tuple
+
+import numpy as np
+from scipy.special import gamma as gamma_function
+
+# the rounding error of the summed gradient grows with the number of observations
+_GRADIENT_TOLERANCE_PER_OBSERVATION = 1e-5
+
+
+def gev_negative_log_likelihood(
+        parameters: np.ndarray,
+        x: np.ndarray
+) -> Tuple[float, np.ndarray]:
+    """
+    Returns the negative log-likelihood and its gradient of the generalized extreme value distribution with
+    ``parameters`` (tail index, location, scale) for the observations ``x``.
+    Outside of the domain of the parameters, the negative log-likelihood is ``inf``.
+    """
+    tail_index, loc, scale = parameters
+    if scale <= 0 or tail_index == 0:
+        return np.inf, np.full(3, np.nan)
+
+    z = (x - loc) / scale
+    t = 1 + tail_index * z
+    if np.any(t <= 0):
+        return np.inf, np.full(3, np.nan)
+
+    log_t = np.log(t)
+    u = np.exp(-log_t / tail_index)
+    value = len(x) * np.log(scale) + (1 + 1 / tail_index) * np.sum(log_t) + np.sum(u)
+
+    scores = gev_scores(z, t, log_t, u, tail_index, scale)
+    return value, np.sum(scores, axis=0)
+
+
+def gev_scores(
+        z: np.ndarray,
+        t: np.ndarray,
+        log_t: np.ndarray,
+        u: np.ndarray,
+        tail_index: float,
+        scale: float
+) -> np.ndarray:
+    """
+    Returns the gradient of the negative log-likelihood of the generalized extreme value distribution per
+    observation, as an array of shape ``(len(z), 3)``.
+    """
+    location_part = (u - 1 - tail_index) / (scale * t)
+    return np.column_stack([
+        -(1 - u) * log_t / tail_index ** 2 + z / t * (1 + (1 - u) / tail_index),
+        location_part,
+        1 / scale + z * location_part,
+    ])
+
+
+def gev_initial_parameters(
+        x: np.ndarray
+) -> np.ndarray:
+    """
+    Returns starting values (tail index, location, scale) for fitting the generalized extreme value distribution,
+    based on probability weighted moments. [1]
+    The tail index is shrunk towards zero until all observations ``x`` are in the support of the distribution.
+
+    1. Hosking, Jonathan RM, James R. Wallis, and Eric F. Wood. "Estimation of the generalized extreme-value
+       distribution by the method of probability-weighted moments." *Technometrics* 27.3 (1985): 251-261.
+    """
+    sorted_x = np.sort(x)
+    n = len(sorted_x)
+    j = np.arange(n)
+    b0 = np.mean(sorted_x)
+    b1 = np.sum(j * sorted_x) / (n * (n - 1))
+    b2 = np.sum(j * (j - 1) * sorted_x) / (n * (n - 1) * (n - 2))
+
+    c = (2 * b1 - b0) / (3 * b2 - b0) - np.log(2) / np.log(3)
+    k = 7.8590 * c + 2.9554 * c ** 2
+    scale = (2 * b1 - b0) * k / (gamma_function(1 + k) * (1 - 2 ** -k))
+    loc = b0 + scale * (gamma_function(1 + k) - 1) / k
+
+    tail_index = -k
+    while np.any(1 + tail_index * (sorted_x[[0, -1]] - loc) / scale <= 0):
+        tail_index /= 2
+    return np.array([tail_index, loc, scale])
+
+
+def gpd_negative_log_likelihood(
+        parameters: np.ndarray,
+        y: np.ndarray
+) -> Tuple[float, np.ndarray]:
+    """
+    Returns the negative log-likelihood and its gradient of the generalized Pareto distribution with
+    ``parameters`` (tail index, scale) for the excesses ``y`` over the fixed location parameter.
+    Outside of the domain of the parameters, the negative log-likelihood is ``inf``.
+    """
+    tail_index, scale = parameters
+    if scale <= 0 or tail_index == 0:
+        return np.inf, np.full(2, np.nan)
+
+    z = y / scale
+    t = 1 + tail_index * z
+    if np.any(t <= 0):
+        return np.inf, np.full(2, np.nan)
+
+    log_t = np.log(t)
+    value = len(y) * np.log(scale) + (1 + 1 / tail_index) * np.sum(log_t)
+    return value, gpd_scores(z, t, log_t, tail_index, scale).sum(axis=0)
+
+
+def gpd_scores(
+        z: np.ndarray,
+        t: np.ndarray,
+        log_t: np.ndarray,
+        tail_index: float,
+        scale: float
+) -> np.ndarray:
+    """
+    Returns the gradient of the negative log-likelihood of the generalized Pareto distribution per observation,
+    as an array of shape ``(len(z), 2)``.
+    """
+    return np.column_stack([
+        -log_t / tail_index ** 2 + (1 + 1 / tail_index) * z / t,
+        (1 - (1 + tail_index) * z / t) / scale,
+    ])
+
+
+def gpd_initial_parameters(
+        y: np.ndarray
+) -> np.ndarray:
+    """
+    Returns starting values (tail index, scale) for fitting the generalized Pareto distribution to the excesses
+    ``y``, based on the method of moments.
+    The tail index is shrunk towards zero until all excesses ``y`` are in the support of the distribution.
+    """
+    mean = np.mean(y)
+    squared_coefficient_of_variation = mean ** 2 / np.var(y)
+    tail_index = (1 - squared_coefficient_of_variation) / 2
+    scale = mean * (1 + squared_coefficient_of_variation) / 2
+
+    while 1 + tail_index * np.max(y) / scale <= 0:
+        tail_index /= 2
+    return np.array([tail_index, scale])
+
+
+def minimize(
+        function: Callable[[np.ndarray], Tuple[float, np.ndarray]],
+        initial_parameters: np.ndarray,
+        initial_hessian: np.ndarray,
+        parameter_scales: Callable[[np.ndarray], np.ndarray],
+        gradient_tolerance: float,
+        maximum_number_of_iterations: int = 500,
+        tolerance: float = 1e-10
+) -> Tuple[np.ndarray, bool]:
+    """
+    Minimizes ``function``, which returns a value and a gradient, using BFGS with a backtracking line search.
+    Steps to parameters where ``function`` is not finite are rejected by the line search.
+    The minimization only counts as converged if the steps have become negligible, or the line search cannot
+    decrease the value any further, at a point where the gradient is negligible: every element of the gradient,
+    multiplied by the natural scale of its parameter given by ``parameter_scales``, is at most
+    ``gradient_tolerance``. This does not depend on the units of the parameters.
+
+    :return: the minimizing parameters and whether the minimization converged.
+    """
+    def is_stationary(parameters: np.ndarray, gradient: np.ndarray) -> bool:
+        return bool(np.all(np.abs(gradient * parameter_scales(parameters)) <= gradient_tolerance))
+
+    parameters = np.asarray(initial_parameters, dtype=np.float64)
+    value, gradient = function(parameters)
+    if not np.isfinite(value):
+        return parameters, False
+
+    try:
+        inverse_hessian = np.linalg.inv(initial_hessian)
+    except np.linalg.LinAlgError:
+        inverse_hessian = np.eye(len(parameters))
+    if not np.all(np.isfinite(inverse_hessian)):
+        inverse_hessian = np.eye(len(parameters))
+
+    for _ in range(maximum_number_of_iterations):
+        direction = -inverse_hessian @ gradient
+        slope = gradient @ direction
+        if not slope < 0:  # not a descent direction: restart from steepest descent
+            inverse_hessian = np.eye(len(parameters))
+            direction, slope = -gradient, -gradient @ gradient
+
+        step_size = 1.
+        while True:
+            new_parameters = parameters + step_size * direction
+            new_value, new_gradient = function(new_parameters)
+            if new_value <= value + 1e-4 * step_size * slope:
+                break
+            step_size /= 2
+            if step_size < 1e-16:  # no further decrease possible within numerical precision
+                return parameters, is_stationary(parameters, gradient)
+
+        step = new_parameters - parameters
+        gradient_change = new_gradient - gradient
+        curvature = step @ gradient_change
+        if curvature > 0:
+            identity = np.eye(len(parameters))
+            inverse_hessian = (
+                (identity - np.outer(step, gradient_change) / curvature)
+                @ inverse_hessian
+                @ (identity - np.outer(gradient_change, step) / curvature)
+                + np.outer(step, step) / curvature
+            )
+
+        parameters, value, gradient = new_parameters, new_value, new_gradient
+        if np.all(np.abs(step) <= tolerance * (1 + np.abs(parameters))):
+            return parameters, is_stationary(parameters, gradient)
+    return parameters, False
+
+
+def fit_gev(
+        x: np.ndarray
+) -> Tuple[np.ndarray, bool]:
+    """
+    Maximum likelihood fit of the generalized extreme value distribution to the observations ``x``.
+
+    :return: the parameters (tail index, location, scale) and whether the fit converged.
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)  # converted once, not on every evaluation
+    if len(x) < 3:
+        return np.full(3, np.nan), False
+    initial_parameters = gev_initial_parameters(x)
+    if not np.all(np.isfinite(initial_parameters)):
+        return initial_parameters, False
+
+    tail_index, loc, scale = initial_parameters
+    z = (x - loc) / scale
+    t = 1 + tail_index * z
+    log_t = np.log(t)
+    scores = gev_scores(z, t, log_t, np.exp(-log_t / tail_index), tail_index, scale)
+    return minimize(
+        lambda parameters: gev_negative_log_likelihood(parameters, x),
+        initial_parameters,
+        scores.T @ scores,  # outer product of the scores approximates the Hessian
+        lambda parameters: np.array([1, parameters[2], parameters[2]]),  # location and scale are in units of scale
+        _GRADIENT_TOLERANCE_PER_OBSERVATION * len(x),
+    )
+
+
+def fit_gpd(
+        y: np.ndarray
+) -> Tuple[np.ndarray, bool]:
+    """
+    Maximum likelihood fit of the generalized Pareto distribution to the excesses ``y`` over the fixed location
+    parameter.
+
+    :return: the parameters (tail index, scale) and whether the fit converged.
+    """
+    y = np.ascontiguousarray(y, dtype=np.float64)  # converted once, not on every evaluation
+    if len(y) < 2:
+        return np.full(2, np.nan), False
+    initial_parameters = gpd_initial_parameters(y)
+    if not np.all(np.isfinite(initial_parameters)):
+        return initial_parameters, False
+
+    tail_index, scale = initial_parameters
+    z = y / scale
+    t = 1 + tail_index * z
+    scores = gpd_scores(z, t, np.log(t), tail_index, scale)
+    return minimize(
+        lambda parameters: gpd_negative_log_likelihood(parameters, y),
+        initial_parameters,
+        scores.T @ scores,  # outer product of the scores approximates the Hessian
+        lambda parameters: np.array([1, parameters[1]]),
+        _GRADIENT_TOLERANCE_PER_OBSERVATION * len(y),
+    )
@@ -4,11 +4,30 @@ import matplotlib.pyplot as plt
 import numpy as np
 from evt import utils
 from evt._compiled_expressions.compiled_expressions import gevmle_fisher_information
+from evt._distributions import gev_survival_function
+from evt.estimators._maximum_likelihood import fit_gev, gev_negative_log_likelihood
 from evt.estimators.estimator_abc import Estimator, Estimate
 from evt.methods.block_maxima import BlockMaxima
 from scipy.stats import genextreme
 
 
+def _diagonal_of_inverse_3x3(
+        matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the diagonal of the inverse of the 3x3 matrix ``matrix``, calculated from the cofactors and the
+    determinant. This avoids the overhead of a general matrix inversion and skips the off-diagonal elements.
+    """
+    (a1, a2, a3), (b1, b2, b3), (c1, c2, c3) = matrix
+    cofactor_1 = b2 * c3 - b3 * c2
+    determinant = a1 * cofactor_1 - a2 * (b1 * c3 - b3 * c1) + a3 * (b1 * c2 - b2 * c1)
+    return np.array([
+        cofactor_1,
+        a1 * c3 - a3 * c1,
+        a1 * b2 - a2 * b1,
+    ]) / determinant
+
+
 class GEVMLE(Estimator):
     r"""
     Maximum likelihood estimator for the generalized extreme value distribution in the block maxima approach with
@@ -51,15 +70,24 @@ class GEVMLE(Estimator):
         :return: maximum likelihood ``Estimate`` including confidence intervals for the tail index,
             location parameter and scale of the generalized extreme value distribution.
         """
-        tail_index, self.loc, self.scale = genextreme.fit(self.block_maxima.block_maxima)
-        self.tail_index = -tail_index  # scipy uses opposite sign for tail index
+        block_maxima = self.block_maxima.block_maxima.to_numpy()
+        parameters, converged = fit_gev(block_maxima)
+        if not converged:
+            tail_index, loc, scale = genextreme.fit(block_maxima)
+            scipy_parameters = np.array([-tail_index, loc, scale])  # scipy uses opposite sign for tail index
+            if not (
+                    gev_negative_log_likelihood(parameters, block_maxima)[0]
+                    < gev_negative_log_likelihood(scipy_parameters, block_maxima)[0]
+            ):
+                parameters = scipy_parameters
+        self.tail_index, self.loc, self.scale = parameters
 
-        std_tail_index, std_loc, std_scale = np.sqrt(np.diag(np.linalg.inv(gevmle_fisher_information(
+        std_tail_index, std_loc, std_scale = np.sqrt(_diagonal_of_inverse_3x3(gevmle_fisher_information(
             self.block_maxima.block_maxima.to_numpy(),
             self.tail_index,
             self.loc,
             self.scale
-        )))) / np.sqrt(len(self.block_maxima.block_maxima))
+        ))) / np.sqrt(len(self.block_maxima.block_maxima))
         std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
         return [
             Estimate(
@@ -91,10 +119,13 @@ class GEVMLE(Estimator):
         if self.tail_index is None:
             raise RuntimeError('The .estimate method must be called before plotting is possible.')
 
-        empirical_survival = 1 - utils.empirical_cdf(self.block_maxima.block_maxima)
-        survival_function = genextreme.sf(
-            empirical_survival.index,
-            -self.tail_index,
+        sorted_values, empirical_cdf = utils._empirical_cdf_arrays(
+            np.sort(self.block_maxima.block_maxima.to_numpy())
+        )
+        empirical_survival = 1 - empirical_cdf
+        survival_function = gev_survival_function(
+            sorted_values,
+            self.tail_index,
             loc=self.loc,
             scale=self.scale
         )
@@ -3,6 +3,8 @@ from typing import List
 import numpy as np
 import matplotlib.pyplot as plt
 from evt import utils
+from evt._distributions import gpd_survival_function
+from evt.estimators._maximum_likelihood import fit_gpd, gpd_negative_log_likelihood
 from evt.estimators.estimator_abc import Estimator, Estimate
 from evt.methods.peaks_over_threshold import PeaksOverThreshold
 from scipy.stats import genpareto
@@ -50,10 +52,20 @@ class GPDMLE(Estimator):
         1. De Haan, Laurens, and Ana Ferreira. *Extreme value theory: an introduction.*
            Springer Science & Business Media, 2007.
         """
-        self.tail_index, _, self.scale = genpareto.fit(
-            self.peaks_over_threshold.series_tail,
-            floc=self.loc
-        )
+        excesses = self.peaks_over_threshold.series_tail.to_numpy() - self.loc
+        parameters, converged = fit_gpd(excesses)
+        if not converged:
+            tail_index, _, scale = genpareto.fit(
+                self.peaks_over_threshold.series_tail,
+                floc=self.loc
+            )
+            scipy_parameters = np.array([tail_index, scale])
+            if not (
+                    gpd_negative_log_likelihood(parameters, excesses)[0]
+                    < gpd_negative_log_likelihood(scipy_parameters, excesses)[0]
+            ):
+                parameters = scipy_parameters
+        self.tail_index, self.scale = parameters
 
         std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
         tail_index_std = (1 + np.abs(self.tail_index)) / np.sqrt(len(self.peaks_over_threshold.series_tail))
@@ -90,9 +102,10 @@ class GPDMLE(Estimator):
         if self.tail_index is None:
             raise RuntimeError('The .estimate method must be called before plotting is possible.')
 
-        empirical_survival = 1 - utils.empirical_cdf(self.peaks_over_threshold.series_tail)
-        survival_function = genpareto.sf(
-            empirical_survival.index,
+        sorted_values, empirical_cdf = utils._empirical_cdf_arrays(self.peaks_over_threshold.sorted_values)
+        empirical_survival = 1 - empirical_cdf
+        survival_function = gpd_survival_function(
+            sorted_values,
             self.tail_index,
             loc=self.loc,
             scale=self.scale
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -29,7 +29,34 @@ class Hill(Estimator):
         super().__init__()
 
         self.peaks_over_threshold = peaks_over_threshold
-        self.order_statistics = utils.order_statistics(peaks_over_threshold.series_tail)
+        self.order_statistics = peaks_over_threshold.order_statistics
+
+        # logs relative to the biggest order statistic, which does not change the estimate
+        log_order_statistics = np.log(self.order_statistics.to_numpy(dtype=np.float64))
+        self._log_order_statistics = log_order_statistics - log_order_statistics[:1]
+        self._cumulative_log_order_statistics = np.cumsum(self._log_order_statistics)
+
+    def _estimate_array(
+            self,
+            numbers_of_order_statistics: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the Hill estimates and the lower and upper bounds of their confidence intervals for all
+        ``numbers_of_order_statistics`` at once, without creating an ``Estimate`` per number of order statistics.
+        The cumulative sum of the log order statistics is calculated on construction, such that every estimate is a
+        lookup.
+        """
+        tail_indices = (
+            self._cumulative_log_order_statistics[numbers_of_order_statistics - 1] / numbers_of_order_statistics
+            - self._log_order_statistics[numbers_of_order_statistics]
+        )
+        standard_deviations = tail_indices / np.sqrt(numbers_of_order_statistics)
+        std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
+        return (
+            tail_indices,
+            tail_indices - std_factor * standard_deviations,
+            tail_indices + std_factor * standard_deviations,
+        )
 
     def estimate(
             self,
@@ -51,25 +78,13 @@ class Hill(Estimator):
         2. De Haan, Laurens, and Ana Ferreira. *Extreme value theory: an introduction.*
            Springer Science & Business Media, 2007.
         """
-        if number_of_order_statistics == 0:
-            raise ValueError('number_of_order_statistics cannot be 0')
+        if number_of_order_statistics < 1:
+            raise ValueError(f'number_of_order_statistics {number_of_order_statistics} must be at least 1')
         if number_of_order_statistics >= len(self.order_statistics):
             raise ValueError(f'number_of_order_statistics {number_of_order_statistics} cannot exceed the '
                              f'number of datapoints in the tail {len(self.order_statistics)}')
 
-        log_of_kth = np.log(self.order_statistics[number_of_order_statistics])
-        tail_index = np.sum(
-            np.log(
-                self.order_statistics[:number_of_order_statistics].values
-            ) - log_of_kth
-        ) / number_of_order_statistics
-        standard_deviation = tail_index / np.sqrt(number_of_order_statistics)
-        std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
-        return [Estimate(
-            tail_index,
-            tail_index - std_factor * standard_deviation,
-            tail_index + std_factor * standard_deviation,
-        )]
+        return [Estimate(*self._estimate_array(np.array(number_of_order_statistics)))]
 
     def plot(
             self,
@@ -88,10 +103,7 @@ class Hill(Estimator):
             max_number_of_order_statistics = len(self.order_statistics) - 1
 
         x_axis = self.order_statistics.index.values[1:max_number_of_order_statistics]
-        estimates, ci_lowers, ci_uppers = map(np.array, zip(*[
-            self.estimate(number_of_order_statistics)[0]
-            for number_of_order_statistics in x_axis
-        ]))
+        estimates, ci_lowers, ci_uppers = self._estimate_array(x_axis)
         ax.plot(
             x_axis,
             estimates,
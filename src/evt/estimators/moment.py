@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -30,7 +30,64 @@ class Moment(Estimator):
         super().__init__()
 
         self.peaks_over_threshold = peaks_over_threshold
-        self.order_statistics = utils.order_statistics(peaks_over_threshold.series_tail)
+        self.order_statistics = peaks_over_threshold.order_statistics
+
+        # logs relative to the biggest order statistic, which does not change the estimate but limits cancellation
+        log_order_statistics = np.log(self.order_statistics.to_numpy(dtype=np.float64))
+        self._log_order_statistics = log_order_statistics - log_order_statistics[:1]
+        self._cumulative_log_order_statistics = np.cumsum(self._log_order_statistics)
+        self._cumulative_squared_log_order_statistics = np.cumsum(np.square(self._log_order_statistics))
+
+    def _estimate_array(
+            self,
+            numbers_of_order_statistics: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the moment estimates and the lower and upper bounds of their confidence intervals for all
+        ``numbers_of_order_statistics`` at once, without creating an ``Estimate`` per number of order statistics.
+        The cumulative sums of the log order statistics and their squares are calculated on construction, such that
+        the first and second moment for every number of order statistics follow from a lookup.
+        """
+        log_of_kth = self._log_order_statistics[numbers_of_order_statistics]
+        mean_log = self._cumulative_log_order_statistics[numbers_of_order_statistics - 1] / numbers_of_order_statistics
+        mean_squared_log = (
+            self._cumulative_squared_log_order_statistics[numbers_of_order_statistics - 1]
+            / numbers_of_order_statistics
+        )
+        hill_part = mean_log - log_of_kth
+        squared_part = mean_squared_log - 2 * log_of_kth * mean_log + np.square(log_of_kth)
+        tail_indices = hill_part + 1 - .5 / (1 - hill_part ** 2 / squared_part)
+
+        standard_deviations = np.sqrt(self._variances(tail_indices)) / np.sqrt(numbers_of_order_statistics)
+        std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
+        return (
+            tail_indices,
+            tail_indices - std_factor * standard_deviations,
+            tail_indices + std_factor * standard_deviations,
+        )
+
+    @staticmethod
+    def _variances(
+            tail_indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the asymptotic variances of the moment estimator corresponding to ``tail_indices``.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):  # both branches are evaluated
+            return np.where(
+                tail_indices >= 0,
+                tail_indices ** 2 + 1,
+                (
+                    (1 - tail_indices) ** 2
+                    * (1 - 2 * tail_indices)
+                    * (1 - tail_indices + 6 * tail_indices ** 2)
+                )
+                /
+                (
+                    (1 - 3 * tail_indices)
+                    * (1 - 4 * tail_indices)
+                )
+            )
 
     def estimate(
             self,
@@ -50,45 +107,13 @@ class Moment(Estimator):
         1. De Haan, Laurens, and Ana Ferreira. *Extreme value theory: an introduction.*
            Springer Science & Business Media, 2007.
         """
-        if number_of_order_statistics == 0:
-            raise ValueError('number_of_order_statistics cannot be 0')
+        if number_of_order_statistics < 1:
+            raise ValueError(f'number_of_order_statistics {number_of_order_statistics} must be at least 1')
         if number_of_order_statistics >= len(self.order_statistics):
             raise ValueError(f'number_of_order_statistics {number_of_order_statistics} cannot exceed the '
                              f'number of datapoints in the tail {len(self.order_statistics)}')
 
-        log_of_kth = np.log(self.order_statistics[number_of_order_statistics])
-        hill_part = np.sum(
-            np.log(
-                self.order_statistics[:number_of_order_statistics].values
-            ) - log_of_kth
-        ) / number_of_order_statistics
-        squared_part = np.sum(
-            np.square(np.log(
-                self.order_statistics[:number_of_order_statistics].values
-            ) - log_of_kth)
-        ) / number_of_order_statistics
-        tail_index = hill_part + 1 - .5 / (1 - hill_part ** 2 / squared_part)
-
-        variance = tail_index ** 2 + 1 if tail_index >= 0 else (
-            (
-                (1 - tail_index) ** 2
-                * (1 - 2 * tail_index)
-                * (1 - tail_index + 6 * tail_index ** 2)
-            )
-            /
-            (
-                (1 - 3 * tail_index)
-                * (1 - 4 * tail_index)
-            )
-        )
-        standard_deviation = np.sqrt(variance) / np.sqrt(number_of_order_statistics)
-        std_factor = utils.confidence_interval_to_std(Estimate.confidence_level)
-
-        return [Estimate(
-            tail_index,
-            tail_index - std_factor * standard_deviation,
-            tail_index + std_factor * standard_deviation,
-        )]
+        return [Estimate(*self._estimate_array(np.array(number_of_order_statistics)))]
 
     def plot(
             self,
@@ -107,10 +132,7 @@ class Moment(Estimator):
             max_number_of_order_statistics = len(self.order_statistics) - 1
 
         x_axis = self.order_statistics.index.values[1:max_number_of_order_statistics]
-        estimates, ci_lowers, ci_uppers = map(np.array, zip(*[
-            self.estimate(number_of_order_statistics)[0]
-            for number_of_order_statistics in x_axis
-        ]))
+        estimates, ci_lowers, ci_uppers = self._estimate_array(x_axis)
         ax.plot(
             x_axis,
             estimates,
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from evt.dataset import Dataset
 import matplotlib.pyplot as plt
@@ -26,18 +27,22 @@ class BlockMaxima:
             series: pd.Series,
             number_of_datapoints_per_block: int
     ) -> pd.Series:
-        values_name, index_name = 'values', 'index'
-        renamed_series = series.copy()
-        renamed_series.name, renamed_series.index.name = values_name, index_name  # prevent collision
+        values = series.to_numpy()
+        number_of_full_blocks = len(values) // number_of_datapoints_per_block
+        number_of_datapoints_in_full_blocks = number_of_full_blocks * number_of_datapoints_per_block
 
-        maxima_series_frame = renamed_series.to_frame().reset_index()
-        maxima_series_indices = maxima_series_frame.groupby(
-            by=lambda row_number: row_number // number_of_datapoints_per_block
-        )[values_name].idxmax()
-        maxima_series = maxima_series_frame.iloc[maxima_series_indices].set_index(index_name)[values_name]
-
-        maxima_series.name, maxima_series.index.name = series.name, series.index.name  # put back to prevent collision
-        return maxima_series
+        full_blocks = values[:number_of_datapoints_in_full_blocks].reshape(
+            number_of_full_blocks,
+            number_of_datapoints_per_block
+        )
+        maxima_indices = [
+            np.arange(number_of_full_blocks) * number_of_datapoints_per_block + full_blocks.argmax(axis=1)
+        ]
+        if number_of_datapoints_in_full_blocks < len(values):  # incomplete last block
+            maxima_indices.append([
+                number_of_datapoints_in_full_blocks + values[number_of_datapoints_in_full_blocks:].argmax()
+            ])
+        return series.iloc[np.concatenate(maxima_indices)]
 
     def plot_block_maxima(
             self,
@@ -46,9 +51,7 @@ class BlockMaxima:
         """
         Plots the block maxima as stars against the original dataset. The blocks are indicated by vertical separators.
         """
-        numbered_indices = self.dataset.series.index.to_series().reset_index(drop=True)
-        block_separator_indices = numbered_indices[numbered_indices.index % self.number_of_datapoints_per_block == 0]
-        block_separators = self.dataset.series.loc[block_separator_indices].index
+        block_separators = self.dataset.series.index[::self.number_of_datapoints_per_block]
 
         ax.plot(
             self.block_maxima,
@@ -64,15 +67,21 @@ class BlockMaxima:
             label='Dataset',
             zorder=100
         )
-        for i, block_separator in enumerate(block_separators):
-            ax.axvline(
-                x=block_separator,
-                linestyle=':',
-                alpha=.3,
-                color='k',
-                label=None if i else 'Block separator',
-                zorder=101
-            )
+        # span the full height like axvline: before matplotlib 3.6, vlines adds the axes coordinates 0 and 1 to the
+        # data limits, so those are restored to keep the separators out of the autoscaling
+        data_limits = ax.dataLim.frozen()
+        ax.vlines(
+            block_separators,
+            ymin=0,
+            ymax=1,
+            transform=ax.get_xaxis_transform(),
+            linestyles=':',
+            alpha=.3,
+            colors='k',
+            label='Block separator',
+            zorder=101
+        )
+        ax.dataLim.set(data_limits)
         ax.set_xlabel(self.dataset.series.index.name or '')
         ax.set_ylabel(self.dataset.series.name or '')
         ax.grid(axis='y')
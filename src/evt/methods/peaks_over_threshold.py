@@ -1,9 +1,38 @@
 from numbers import Real
+from typing import Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from evt import utils
+from evt._distributions import fit_exponential, gpd_survival_function
 from evt.dataset import Dataset
-from scipy.stats import expon
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional
+    numexpr = None
+
+_MIN_NUMBER_OF_DATAPOINTS_FOR_NUMEXPR = 1_000_000
+
+
+def _exceeds(
+        values: np.ndarray,
+        threshold: Real
+) -> np.ndarray:
+    """
+    Returns the boolean mask ``values > threshold``.
+    For big ``float64`` arrays, the comparison is evaluated in multiple threads by ``numexpr``, if it is installed.
+    Single-threaded, ``numexpr`` is no faster than ``numpy``, and for small arrays the thread pool dominates.
+    """
+    if (
+            numexpr is not None
+            and numexpr.get_num_threads() > 1
+            and values.dtype == np.float64
+            and values.size >= _MIN_NUMBER_OF_DATAPOINTS_FOR_NUMEXPR
+    ):
+        return numexpr.evaluate('values > threshold', local_dict={'values': values, 'threshold': threshold})
+    return values > threshold
 
 
 class PeaksOverThreshold:
@@ -22,26 +51,88 @@ class PeaksOverThreshold:
         self.threshold = threshold
 
         self.dataset = dataset
-        self.series_tail = dataset.series[dataset.series > threshold].copy()
+        values = dataset.values
+        self._tail_mask = _exceeds(values, threshold)
+        self._tail_mask.flags.writeable = False
+        self.series_tail = pd.Series(
+            values[self._tail_mask],
+            index=dataset.series.index[self._tail_mask],
+            name=dataset.series.name
+        )
+        self._sorted_values = None
+        self._order_statistics = None
+        self._empirical_survival = None
+
+    @property
+    def tail_mask(self) -> np.ndarray:
+        """
+        Read-only boolean ``np.ndarray`` that indicates which datapoints of ``dataset.series`` exceed the threshold.
+        """
+        return self._tail_mask
+
+    @property
+    def sorted_values(self) -> np.ndarray:
+        """
+        Read-only ``np.ndarray`` of the peaks over threshold, sorted in ascending order.
+        Calculated once on first access. If the dataset has already been sorted, for example when sweeping over
+        thresholds, this is a slice of ``dataset.sorted_values``. Otherwise, only the tail is sorted.
+        """
+        if self._sorted_values is None:
+            if self.dataset._sorted_values is not None:
+                sorted_values = self.dataset._sorted_values
+                self._sorted_values = sorted_values[np.searchsorted(sorted_values, self.threshold, side='right'):]
+            else:
+                self._sorted_values = np.sort(self.series_tail.to_numpy())
+                self._sorted_values.flags.writeable = False
+        return self._sorted_values
+
+    @property
+    def order_statistics(self) -> pd.Series:
+        """
+        Order statistics of the peaks over threshold, see ``utils.order_statistics``.
+        Calculated once on first access and shared by the estimators that use them.
+        """
+        if self._order_statistics is None:
+            self._order_statistics = utils.order_statistics(self.series_tail, self.sorted_values)
+        return self._order_statistics
+
+    @property
+    def empirical_survival(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unique values of the peaks over threshold in ascending order and their empirical survival function, see
+        ``utils.empirical_cdf``.
+        Calculated once on first access and shared by the exponential Q-Q plot and the Zipf plot.
+        """
+        if self._empirical_survival is None:
+            sorted_values, empirical_cdf = utils._empirical_cdf_arrays(self.sorted_values)
+            empirical_survival = 1 - empirical_cdf
+            for array in (sorted_values, empirical_survival):
+                array.flags.writeable = False
+            self._empirical_survival = sorted_values, empirical_survival
+        return self._empirical_survival
 
     def plot_tail(
             self,
-            ax: plt.Axes
+            ax: plt.Axes,
+            max_number_of_points: int = 2000
     ):
         """
         Plot the peaks over threshold against the index of the original data.
         The original dataset is shown for comparison.
+
+        The original dataset is thinned to at most ``max_number_of_points`` evenly spaced points to bound the
+        rendering cost for big datasets. All peaks over threshold are shown.
+        If ``None``, all points of the original dataset are shown.
         """
+        dataset_indices = utils._thinning_indices(len(self.dataset.series), max_number_of_points)
         ax.plot(
-            self.dataset.series[
-                self.dataset.series.index.isin(self.series_tail.index)
-            ],
+            self.dataset.series[self._tail_mask],
             'xr',
             label='Tail',
             zorder=101
         )
         ax.plot(
-            self.dataset.series,
+            self.dataset.series.iloc[dataset_indices],
             '-k',
             alpha=.3,
             label='Dataset',
@@ -63,20 +154,31 @@ class PeaksOverThreshold:
 
     def plot_qq_exponential(
             self,
-            ax: plt.Axes
+            ax: plt.Axes,
+            max_number_of_points: int = 2000,
+            rasterize: bool = False
     ):
         """
         Quantile-quantile plot of the empirical survival function of the peaks over threshold against a fitted
         exponential distribution.
+
+        At most ``max_number_of_points`` points are shown, increasingly dense towards the extremes, to bound the
+        rendering cost for big tails. If ``None``, all points are shown.
+        If ``rasterize``, the points are rasterized in vector output such as SVG or PDF, which keeps the file size
+        constant for big tails.
         """
-        empirical_survival = 1 - utils.empirical_cdf(self.series_tail)
-        loc, scale = expon.fit(self.series_tail)
-        survival_function = expon.sf(empirical_survival.index, loc=loc, scale=scale)
+        sorted_values, empirical_survival = self.empirical_survival
+        indices = utils._thinning_indices(len(sorted_values), max_number_of_points, logarithmic=True)
+        sorted_values = sorted_values[indices]
+        empirical_survival = empirical_survival[indices]
+        loc, scale = fit_exponential(self.series_tail.to_numpy())
+        survival_function = gpd_survival_function(sorted_values, 0, loc, scale)  # the exponential distribution
         ax.loglog(
             survival_function,
             empirical_survival,
             'xk',
-            alpha=.8
+            alpha=.8,
+            rasterized=rasterize
         )
         ax.plot(
             survival_function,
@@ -94,19 +196,29 @@ class PeaksOverThreshold:
 
     def plot_zipf(
             self,
-            ax: plt.Axes
+            ax: plt.Axes,
+            max_number_of_points: int = 2000,
+            rasterize: bool = False
     ):
         """
         Log-log plot of the empirical survival function. The :math:`x`-axis corresponds to the values of the original
         dataset.
+
+        At most ``max_number_of_points`` points are shown, increasingly dense towards the extremes, to bound the
+        rendering cost for big tails. If ``None``, all points are shown.
+        If ``rasterize``, the points are rasterized in vector output such as SVG or PDF, which keeps the file size
+        constant for big tails.
         """
-        empirical_survival = 1 - utils.empirical_cdf(self.series_tail)
+        sorted_values, empirical_survival = self.empirical_survival
+        indices = utils._thinning_indices(len(sorted_values), max_number_of_points, logarithmic=True)
 
         ax.loglog(
-            empirical_survival,
+            sorted_values[indices],
+            empirical_survival[indices],
             'xk',
             label='Empirical survival',
-            alpha=.8
+            alpha=.8,
+            rasterized=rasterize
         )
         ax.set_xlabel(self.series_tail.name or '')
         ax.set_ylabel('Empirical survival function')
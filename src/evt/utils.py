@@ -1,49 +1,76 @@
+from functools import lru_cache
 from numbers import Real
 from pathlib import Path
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy.stats import norm
 
 
 def empirical_cdf(
-        series: pd.Series
+        series: pd.Series,
+        sorted_ascending: np.ndarray = None
 ) -> pd.Series:
     """
     Calculates the empirical distribution function given a ``pd.Series`` ``series``. The resulting CDF will have values
     between 0 and 1, exclusive. The index is ignored.
 
     :param series: ``pd.Series`` of which to calculate the empirical distribution function.
+    :param sorted_ascending: optionally, the values of ``series`` sorted in ascending order, such that sorting is
+        skipped.
     :return: ``pd.Series``, the empirical distribution function. The index corresponds to the values of the ``series``.
     """
-    cdf = series.sort_values().reset_index(drop=True)
+    if sorted_ascending is None:
+        sorted_ascending = np.sort(series.to_numpy())
+    values, cdf = _empirical_cdf_arrays(sorted_ascending)
+    return pd.Series(cdf, index=pd.Index(values, name=series.name))
 
-    cdf.index += 1  # 0 < lowest <= highest < 1
-    size = cdf.shape[0] + 1
-    cdf.index = cdf.index / size
-    cdf.drop_duplicates(
-        keep='first',
-        inplace=True
-    )
-    return pd.Series(cdf.index.values, index=cdf)
 
+def _empirical_cdf_arrays(
+        sorted_values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the empirical distribution function like ``empirical_cdf``, but on and to ``np.ndarray``:
+    returns the unique values of the ascending ``sorted_values`` and the corresponding values of the empirical
+    distribution function.
+    """
+    cdf = np.arange(1, len(sorted_values) + 1) / (len(sorted_values) + 1)  # 0 < lowest <= highest < 1
+
+    is_first_of_duplicates = np.empty(len(sorted_values), dtype=bool)
+    is_first_of_duplicates[:1] = True
+    np.not_equal(sorted_values[1:], sorted_values[:-1], out=is_first_of_duplicates[1:])
+    return sorted_values[is_first_of_duplicates], cdf[is_first_of_duplicates]
 
-def mean_excess(series: pd.Series) -> pd.Series:
+
+def mean_excess(
+        series: pd.Series,
+        sorted_ascending: np.ndarray = None
+) -> pd.Series:
     """
     Calculates the mean excess (average excess of a threshold) for values in the ``pd.Series`` ``series``.
     For every value in ``series``, the mean excess of the rest of the distribution will be calculated.
 
     :param series: ``pd.Series`` of which the mean excess will be calculated. The index is ignored.
+    :param sorted_ascending: optionally, the values of ``series`` sorted in ascending order, such that sorting is
+        skipped.
     :return: ``pd.Series`` corresponding to the mean excesses. The index corresponds to the threshold.
     """
-    sorted_values = series.sort_values(ascending=False).reset_index(drop=True)
+    if sorted_ascending is None:
+        sorted_ascending = np.sort(series.to_numpy())
+    sorted_values = sorted_ascending[::-1]
+    number_of_bigger_values = np.arange(len(sorted_values))
+    sum_of_bigger_values = np.concatenate([[0], np.cumsum(sorted_values)[:-1]])
 
-    mean_excess_duplicates = (
-        sorted_values.cumsum().shift(1) - sorted_values.index * sorted_values
-    ) / sorted_values.index
-    mean_excess_duplicates.index = sorted_values.values
-    mean_excess = mean_excess_duplicates[~mean_excess_duplicates.index.duplicated()]
+    # the first of duplicate thresholds only has strictly bigger values above it, the biggest value has none
+    is_threshold = np.zeros(len(sorted_values), dtype=bool)
+    np.not_equal(sorted_values[1:], sorted_values[:-1], out=is_threshold[1:])
 
-    return mean_excess.dropna().sort_index()
+    thresholds = sorted_values[is_threshold]
+    mean_excess = (
+        sum_of_bigger_values[is_threshold] - number_of_bigger_values[is_threshold] * thresholds
+    ) / number_of_bigger_values[is_threshold]
+    return pd.Series(mean_excess[::-1], index=thresholds[::-1])
 
 
 def scientific_notation(
@@ -53,42 +80,75 @@ def scientific_notation(
     """
     Returns the scientific notation of ``number`` in ``number_of_significant_digits`` significant digits.
     """
-    significand, exponent = f'{number:.{number_of_significant_digits}E}'.split('E')
+    # a single correctly rounded formatting call: rounding the significand arithmetically goes wrong for ties
+    significand, _, exponent = f'{number:.{number_of_significant_digits}E}'.partition('E')
     exponent_int = int(exponent)
-    exponent_text = rf'\cdot 10^{{{exponent_int}}}' if exponent_int else ''
-    return rf'${significand} {exponent_text}$'
+    if exponent_int:
+        return rf'${significand} \cdot 10^{{{exponent_int}}}$'
+    return rf'${significand} $'
 
 
 def order_statistics(
-        series: pd.Series
+        series: pd.Series,
+        sorted_ascending: np.ndarray = None
 ) -> pd.Series:
     """
     Calculates the order statistics (sorted maxima) of a ``pd.Series``.
 
     :param series: ``pd.Series`` of which to calculate the order statistics. The index is ignored.
+    :param sorted_ascending: optionally, the values of ``series`` sorted in ascending order, such that sorting is
+        skipped.
     :return: ``pd.Series``, where the index corresponds to the ascending index of the order statistic, where 0 is the
         biggest.
     """
-    return series.sort_values(
-        ascending=False
-    ).reset_index(
-        drop=True
-    )
+    if sorted_ascending is None:
+        return series.sort_values(
+            ascending=False
+        ).reset_index(
+            drop=True
+        )
+    return pd.Series(sorted_ascending[::-1], name=series.name)
+
+
+def _thinning_indices(
+        number_of_points: int,
+        max_number_of_points: int = None,
+        logarithmic: bool = False
+) -> np.ndarray:
+    """
+    Returns sorted indices of at most ``max_number_of_points`` out of ``number_of_points`` points, including the first
+    and the last point, to limit the number of points that are plotted.
+    The indices are evenly spaced or, if ``logarithmic``, increasingly dense towards the last point, which suits
+    log-log plots of a survival function against ascending values.
+    If ``max_number_of_points`` is ``None``, all indices are returned.
+    """
+    if max_number_of_points is None or number_of_points <= max_number_of_points:
+        return np.arange(number_of_points)
+    if logarithmic:
+        positions = number_of_points - np.geomspace(1, number_of_points, max_number_of_points)
+    else:
+        positions = np.linspace(0, number_of_points - 1, max_number_of_points)
+    return np.unique(positions.astype(np.int64))
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def repo_root() -> Path:
     """ Returns the root path of the repository. """
-    return Path(__file__).parent.parent.parent  # pragma: no cover
+    return _REPO_ROOT  # pragma: no cover
 
 
+@lru_cache(maxsize=128)
 def confidence_interval_to_std(
         confidence: Real
 ) -> Real:
     """
     Returns the number of standard deviations of a standard normal distribution, corresponding to a confidence
     interval with confidence level ``confidence``.
+    The result is cached, as the estimators call this with the same confidence level on every estimate.
 
     :param confidence: confidence interval, between 0 (inclusive) and 1 (exclusive).
     :return: ``Real``
     """
-    return norm.ppf(.5 + confidence / 2)
+    return float(norm.ppf(.5 + confidence / 2))  # a plain float rather than a 0-d array from the cache
@@ -80,6 +80,21 @@ class TestPeaksOverThreshold(unittest.TestCase):
             block_maxima.block_maxima.values
         )))
 
+    def test_three_datapoints_per_block_unordered(self):
+        dataset = Dataset(pd.Series(
+            [3, 1, 2, 2, 5, 5, 0, 4],
+            index=range(20, 28)
+        ))
+        block_maxima = BlockMaxima(dataset, 3)
+        self.assertTrue(np.all(np.isclose(
+            [20, 24, 27],
+            block_maxima.block_maxima.index
+        )))
+        self.assertTrue(np.all(np.isclose(
+            [3, 5, 4],
+            block_maxima.block_maxima.values
+        )))
+
     def test_plot_block_maxima(self):
         block_maxima = BlockMaxima(self.dataset, 1)
 
@@ -97,6 +112,32 @@ class TestPeaksOverThreshold(unittest.TestCase):
             hashed
         )
 
+    def test_plot_block_maxima_ylim(self):
+        series = pd.Series(
+            np.linspace(100, 200, 20),
+            index=pd.date_range('2000-01-01', periods=20, freq='D')
+        )
+        block_maxima = BlockMaxima(Dataset(series), 5)
+
+        fig, (ax, reference_ax) = plt.subplots(1, 2)
+        block_maxima.plot_block_maxima(ax)
+        reference_ax.plot(series, '-k')
+
+        self.assertTrue(np.all(np.isclose(
+            reference_ax.get_ylim(),
+            ax.get_ylim()
+        )))
+
+        # autoscaling still applies to data that is plotted afterwards
+        ax.plot(series.index[[0, -1]], [0, 300])
+        reference_ax.plot(series.index[[0, -1]], [0, 300])
+        self.assertTrue(ax.get_autoscaley_on())
+        self.assertTrue(np.all(np.isclose(
+            reference_ax.get_ylim(),
+            ax.get_ylim()
+        )))
+        plt.close(fig)
+
     def test_plot_block_maxima_boxplot(self):
         block_maxima = BlockMaxima(self.dataset, 1)
 
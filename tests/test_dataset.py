@@ -26,6 +26,11 @@ class TestDataset(unittest.TestCase):
         with self.assertRaises(ValueError):
             Dataset(series)
 
+    def test_nullable_nans(self):
+        series = pd.Series(data=[1, 2, pd.NA, 3], dtype='Float64')
+        with self.assertRaisesRegex(ValueError, 'There are 1 NaNs in the series.'):
+            Dataset(series)
+
     def test_inf(self):
         series = pd.Series(data=[1, 2, np.inf, 3])
         with self.assertRaises(ValueError):
@@ -36,6 +41,34 @@ class TestDataset(unittest.TestCase):
         dataset = Dataset(series)
         self.assertNotEqual(id(series), id(dataset.series))
 
+    def test_no_data_copy(self):
+        series = pd.Series(data=[1., 2., 3.])
+        dataset = Dataset(series)
+        self.assertTrue(np.shares_memory(series.to_numpy(), dataset.series.to_numpy()))
+        self.assertTrue(np.shares_memory(series.to_numpy(), dataset.values))
+
+    def test_values(self):
+        series = pd.Series(data=[3, 1, 2])
+        dataset = Dataset(series)
+        self.assertListEqual([3., 1., 2.], dataset.values.tolist())
+        self.assertEqual(np.float64, dataset.values.dtype)
+        self.assertTrue(dataset.values.flags.c_contiguous)
+        self.assertFalse(dataset.values.flags.writeable)
+
+        series = pd.Series(data=[1., 2., 3.])
+        Dataset(series)
+        series.iloc[0] = 4.  # the original series remains writeable
+
+    def test_sorted_values(self):
+        series = pd.Series(data=[3, 1, 2])
+        dataset = Dataset(series)
+        self.assertTrue(np.all(np.isclose(
+            [1, 2, 3],
+            dataset.sorted_values
+        )))
+        self.assertIs(dataset.sorted_values, dataset.sorted_values)
+        self.assertFalse(dataset.sorted_values.flags.writeable)
+
     def test_duplicated(self):
         series = pd.Series(data=[1, 2, 3, 4], index=[1, 1, 1, 2])
         with self.assertRaises(ValueError):
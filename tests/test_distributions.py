@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+from evt._distributions import fit_exponential, gev_survival_function, gpd_survival_function
+from scipy.stats import expon, genextreme, genpareto
+
+
+class TestDistributions(unittest.TestCase):
+    def test_gev_survival_function(self):
+        x = np.linspace(-5, 15, 21)
+        for tail_index in [-.3, 0, .3]:
+            self.assertTrue(np.all(np.isclose(
+                genextreme.sf(x, -tail_index, loc=3, scale=2),
+                gev_survival_function(x, tail_index, loc=3, scale=2)
+            )))
+
+    def test_gpd_survival_function(self):
+        x = np.linspace(0, 20, 21)
+        for tail_index in [-.3, 0, .3]:
+            self.assertTrue(np.all(np.isclose(
+                genpareto.sf(x, tail_index, loc=1, scale=2),
+                gpd_survival_function(x, tail_index, loc=1, scale=2)
+            )))
+
+    def test_fit_exponential(self):
+        sample = expon.rvs(loc=1, scale=2, size=50, random_state=3)
+        self.assertTrue(np.all(np.isclose(
+            expon.fit(sample),
+            fit_exponential(sample),
+            rtol=1e-14
+        )))
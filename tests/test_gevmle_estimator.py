@@ -2,11 +2,14 @@ import hashlib
 import io
 import unittest
 
+import numpy as np
 import pandas as pd
 from evt.dataset import Dataset
-from evt.estimators.gevmle import GEVMLE
+from evt.estimators._maximum_likelihood import fit_gev
+from evt.estimators.gevmle import GEVMLE, _diagonal_of_inverse_3x3
 from evt.methods.block_maxima import BlockMaxima
 from matplotlib import pyplot as plt
+from scipy.stats import genextreme
 
 
 class TestGEVMLE(unittest.TestCase):
@@ -21,42 +24,74 @@ class TestGEVMLE(unittest.TestCase):
     def test_estimate(self):
         estimates = self.gevmle.estimate()
         self.assertAlmostEqual(
-            -0.4647220177842265,
+            -0.46472208395415926,
             estimates[0].estimate
         )
         self.assertAlmostEqual(
-            -1.230942675038333,
+            -1.2309425158219947,
             estimates[0].ci_lower
         )
         self.assertAlmostEqual(
-            0.3014986394698801,
+            0.301498347913676,
             estimates[0].ci_upper
         )
         self.assertAlmostEqual(
-            473.51719544433735,
+            473.5171575621436,
             estimates[1].estimate
         )
         self.assertAlmostEqual(
-            246.21093397263186,
+            246.2108784517998,
             estimates[1].ci_lower
         )
         self.assertAlmostEqual(
-            700.8234569160428,
+            700.8234366724874,
             estimates[1].ci_upper
         )
         self.assertAlmostEqual(
-            305.7608338850753,
+            305.76084814514735,
             estimates[2].estimate
         )
         self.assertAlmostEqual(
-            111.82303722965494,
+            111.82300936886628,
             estimates[2].ci_lower
         )
         self.assertAlmostEqual(
-            499.6986305404956,
+            499.6986869214284,
             estimates[2].ci_upper
         )
 
+    def test_estimate_scipy_fallback(self):
+        sample = genextreme.rvs(.5, size=9, random_state=40)  # not converged by the quasi-Newton method
+        gevmle = GEVMLE(BlockMaxima(Dataset(pd.Series(sample)), number_of_datapoints_per_block=1))
+        estimates = gevmle.estimate()
+        tail_index, loc, scale = genextreme.fit(sample)
+        self.assertTrue(np.all(np.isclose(
+            [-tail_index, loc, scale],
+            [estimate.estimate for estimate in estimates]
+        )))
+
+    def test_estimate_lower_negative_log_likelihood(self):
+        sample = genextreme.rvs(.2, size=9, random_state=40)  # not converged, but better than scipy
+        gevmle = GEVMLE(BlockMaxima(Dataset(pd.Series(sample)), number_of_datapoints_per_block=1))
+        estimates = gevmle.estimate()
+        parameters, converged = fit_gev(sample)
+        self.assertFalse(converged)
+        self.assertTrue(np.all(np.isclose(
+            parameters,
+            [estimate.estimate for estimate in estimates]
+        )))
+
+    def test_diagonal_of_inverse_3x3(self):
+        matrix = np.array([
+            [4., 1., 2.],
+            [1., 3., .5],
+            [2., .5, 5.],
+        ])
+        self.assertTrue(np.all(np.isclose(
+            np.diag(np.linalg.inv(matrix)),
+            _diagonal_of_inverse_3x3(matrix)
+        )))
+
     def test_runtime_error(self):
         fig = plt.figure(figsize=(8, 6))
         ax = plt.gca()
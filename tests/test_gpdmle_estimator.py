@@ -25,13 +25,13 @@ class TestGPDMLE(unittest.TestCase):
             (scale_estimate, scale_ci_lower, scale_ci_upper),
         ) = self.gpdmle.estimate()
 
-        self.assertAlmostEqual(0.4850660575136194, tail_index_estimate)
-        self.assertAlmostEqual(-0.816627816142266, tail_index_ci_lower)
-        self.assertAlmostEqual(1.7867599311695048, tail_index_ci_upper)
+        self.assertAlmostEqual(0.485066761554453, tail_index_estimate)
+        self.assertAlmostEqual(-0.8166277292090924, tail_index_ci_lower)
+        self.assertAlmostEqual(1.7867612523179985, tail_index_ci_upper)
 
-        self.assertAlmostEqual(10.164192059236363, scale_estimate)
-        self.assertAlmostEqual(8.594893265235651, scale_ci_lower)
-        self.assertAlmostEqual(11.733490853237075, scale_ci_upper)
+        self.assertAlmostEqual(10.164174202763704, scale_estimate)
+        self.assertAlmostEqual(8.594874896887672, scale_ci_lower)
+        self.assertAlmostEqual(11.733473508639735, scale_ci_upper)
 
     def test_runtime_error(self):
         fig = plt.figure(figsize=(8, 6))
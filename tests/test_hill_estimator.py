@@ -23,6 +23,10 @@ class TestHillEstimator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.hill_estimator.estimate(0)
 
+    def test_negative_order_statistics(self):
+        with self.assertRaises(ValueError):
+            self.hill_estimator.estimate(-1)
+
     def test_too_many_order_statistics(self):
         with self.assertRaises(ValueError):
             self.hill_estimator.estimate(5)  # there are 5 datapoints, so we cannot get the 5th order statistic
@@ -33,6 +37,18 @@ class TestHillEstimator(unittest.TestCase):
         self.assertAlmostEqual(-0.2631714681523434, ci_lower)
         self.assertAlmostEqual(4.263171468152343, ci_upper)
 
+    def test_hill_estimator_all_order_statistics(self):
+        log_order_statistics = np.log(np.sort(self.series.values)[::-1])
+        for number_of_order_statistics in range(1, len(self.series)):
+            (estimate, _, _), = self.hill_estimator.estimate(number_of_order_statistics)
+            self.assertAlmostEqual(
+                np.mean(
+                    log_order_statistics[:number_of_order_statistics]
+                    - log_order_statistics[number_of_order_statistics]
+                ),
+                estimate
+            )
+
     def test_plot(self):
         fig = plt.figure(figsize=(8, 6))
         ax = plt.gca()
@@ -0,0 +1,122 @@
+import unittest
+
+import numpy as np
+from evt.estimators._maximum_likelihood import (
+    fit_gev,
+    fit_gpd,
+    gev_negative_log_likelihood,
+    gpd_negative_log_likelihood,
+    minimize,
+)
+from scipy.stats import genextreme, genpareto
+
+
+class TestMaximumLikelihood(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gev_sample = genextreme.rvs(-.2, loc=3, scale=2, size=50, random_state=1)
+        self.gpd_sample = genpareto.rvs(.3, scale=2, size=50, random_state=2)
+
+    def assert_gradient(self, function, parameters, sample):
+        _, gradient = function(parameters, sample)
+        step = 1e-6
+        numerical_gradient = [
+            (function(parameters + delta, sample)[0] - function(parameters - delta, sample)[0]) / (2 * step)
+            for delta in np.eye(len(parameters)) * step
+        ]
+        self.assertTrue(np.all(np.isclose(
+            numerical_gradient,
+            gradient,
+            rtol=1e-5
+        )))
+
+    def test_gev_negative_log_likelihood(self):
+        parameters = np.array([.15, 3.1, 1.9])
+        value, _ = gev_negative_log_likelihood(parameters, self.gev_sample)
+        self.assertAlmostEqual(
+            genextreme.nnlf((-parameters[0], parameters[1], parameters[2]), self.gev_sample),
+            value
+        )
+        self.assert_gradient(gev_negative_log_likelihood, parameters, self.gev_sample)
+
+    def test_gev_negative_log_likelihood_outside_support(self):
+        value, _ = gev_negative_log_likelihood(np.array([-1, 0, 1]), self.gev_sample)
+        self.assertEqual(np.inf, value)
+
+    def test_gpd_negative_log_likelihood(self):
+        parameters = np.array([.25, 2.1])
+        value, _ = gpd_negative_log_likelihood(parameters, self.gpd_sample)
+        self.assertAlmostEqual(
+            genpareto.nnlf((parameters[0], 0, parameters[1]), self.gpd_sample),
+            value
+        )
+        self.assert_gradient(gpd_negative_log_likelihood, parameters, self.gpd_sample)
+
+    def test_fit_gev(self):
+        parameters, converged = fit_gev(self.gev_sample)
+        self.assertTrue(converged)
+        tail_index, loc, scale = genextreme.fit(self.gev_sample)
+        self.assertLessEqual(
+            gev_negative_log_likelihood(parameters, self.gev_sample)[0],
+            genextreme.nnlf((tail_index, loc, scale), self.gev_sample)
+        )
+        self.assertTrue(np.all(np.isclose(
+            [-tail_index, loc, scale],
+            parameters,
+            rtol=1e-3
+        )))
+
+    def test_fit_gpd(self):
+        parameters, converged = fit_gpd(self.gpd_sample)
+        self.assertTrue(converged)
+        tail_index, _, scale = genpareto.fit(self.gpd_sample, floc=0)
+        self.assertLessEqual(
+            gpd_negative_log_likelihood(parameters, self.gpd_sample)[0],
+            genpareto.nnlf((tail_index, 0, scale), self.gpd_sample)
+        )
+        self.assertTrue(np.all(np.isclose(
+            [tail_index, scale],
+            parameters,
+            rtol=1e-3
+        )))
+
+    def test_fit_scale_invariance(self):
+        scale = 1e-6
+        gev_parameters, _ = fit_gev(self.gev_sample)
+        parameters, converged = fit_gev(self.gev_sample * scale)
+        self.assertTrue(converged)
+        self.assertTrue(np.all(np.isclose(
+            gev_parameters * [1, scale, scale],
+            parameters,
+            rtol=1e-6
+        )))
+
+        gpd_parameters, _ = fit_gpd(self.gpd_sample)
+        parameters, converged = fit_gpd(self.gpd_sample * scale)
+        self.assertTrue(converged)
+        self.assertTrue(np.all(np.isclose(
+            gpd_parameters * [1, scale],
+            parameters,
+            rtol=1e-6
+        )))
+
+    def test_line_search_failure(self):
+        # the gradient points the wrong way, such that the line search cannot decrease the value
+        _, converged = minimize(
+            lambda parameters: (float(parameters @ parameters), -2 * parameters),
+            np.array([1.]),
+            np.eye(1),
+            np.ones_like,
+            1e-6
+        )
+        self.assertFalse(converged)
+
+    def test_fit_gev_not_converged(self):
+        sample = genextreme.rvs(.5, size=9, random_state=40)
+        _, converged = fit_gev(sample)
+        self.assertFalse(converged)
+
+    def test_too_few_datapoints(self):
+        _, converged = fit_gev(np.array([1., 2.]))
+        self.assertFalse(converged)
+        _, converged = fit_gpd(np.array([1.]))
+        self.assertFalse(converged)
@@ -23,6 +23,10 @@ class TestMomentEstimator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.moment_estimator.estimate(0)
 
+    def test_negative_order_statistics(self):
+        with self.assertRaises(ValueError):
+            self.moment_estimator.estimate(-1)
+
     def test_too_many_order_statistics(self):
         with self.assertRaises(ValueError):
             self.moment_estimator.estimate(5)  # there are 5 datapoints, so we cannot get the 5th order statistic
@@ -39,6 +43,21 @@ class TestMomentEstimator(unittest.TestCase):
         self.assertAlmostEqual(-0.5956531757207271, ci_lower)
         self.assertAlmostEqual(1.595653175720727, ci_upper)
 
+    def test_moment_estimator_all_order_statistics(self):
+        log_order_statistics = np.log(np.sort(self.series.values)[::-1])
+        for number_of_order_statistics in range(2, len(self.series)):
+            log_excesses = (
+                log_order_statistics[:number_of_order_statistics]
+                - log_order_statistics[number_of_order_statistics]
+            )
+            hill_part = np.mean(log_excesses)
+            squared_part = np.mean(np.square(log_excesses))
+            (estimate, _, _), = self.moment_estimator.estimate(number_of_order_statistics)
+            self.assertAlmostEqual(
+                hill_part + 1 - .5 / (1 - hill_part ** 2 / squared_part),
+                estimate
+            )
+
     def test_plot(self):
         fig = plt.figure(figsize=(8, 6))
         ax = plt.gca()
@@ -1,6 +1,7 @@
 import hashlib
 import io
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -23,6 +24,99 @@ class TestPeaksOverThreshold(unittest.TestCase):
             pot.series_tail
         )))
 
+    def test_tail_names(self):
+        series = pd.Series(range(1, 101), index=range(100, 200), name='dataset')
+        series.index.name = 'dataset index'
+        pot = PeaksOverThreshold(Dataset(series), threshold=97)
+        self.assertEqual('dataset', pot.series_tail.name)
+        self.assertEqual('dataset index', pot.series_tail.index.name)
+        self.assertTrue(np.all(np.isclose(
+            [197, 198, 199],
+            pot.series_tail.index
+        )))
+
+    def test_sorted_values(self):
+        series = pd.Series([3, 1, 4, 1, 5, 2])
+        pot = PeaksOverThreshold(Dataset(series), threshold=2)
+        self.assertTrue(np.all(np.isclose(
+            [3, 4, 5],
+            pot.sorted_values
+        )))
+        self.assertIsNone(pot.dataset._sorted_values)  # only the tail is sorted
+        self.assertFalse(pot.sorted_values.flags.writeable)
+
+    def test_sorted_values_sorted_dataset(self):
+        series = pd.Series([3, 1, 4, 1, 5, 2])
+        dataset = Dataset(series)
+        dataset.sorted_values
+        pot = PeaksOverThreshold(dataset, threshold=2)
+        self.assertTrue(np.all(np.isclose(
+            [3, 4, 5],
+            pot.sorted_values
+        )))
+        self.assertTrue(np.shares_memory(dataset.sorted_values, pot.sorted_values))
+
+    def test_tail_mask(self):
+        series = pd.Series([3, 1, 4, 1, 5, 2])
+        pot = PeaksOverThreshold(Dataset(series), threshold=2)
+        self.assertListEqual(
+            [True, False, True, False, True, False],
+            pot.tail_mask.tolist()
+        )
+        self.assertFalse(pot.tail_mask.flags.writeable)
+
+    def test_tail_mask_big_dataset(self):
+        series = pd.Series(np.linspace(0, 1, 1_000_001))
+        pot = PeaksOverThreshold(Dataset(series), threshold=.999999)
+        self.assertEqual(1, np.sum(pot.tail_mask))
+        self.assertTrue(pot.tail_mask[-1])
+
+    def test_tail_mask_numexpr(self):
+        class NumexprStub:
+            def __init__(self, number_of_threads):
+                self.number_of_threads = number_of_threads
+                self.number_of_evaluations = 0
+
+            def get_num_threads(self):
+                return self.number_of_threads
+
+            def evaluate(self, expression, local_dict):
+                self.number_of_evaluations += 1
+                return local_dict['values'] > local_dict['threshold']
+
+        values = np.linspace(0, 1, 1_000_001)
+        dataset = Dataset(pd.Series(values))
+        for number_of_threads, number_of_evaluations in [(1, 0), (2, 1)]:
+            numexpr_stub = NumexprStub(number_of_threads)
+            with mock.patch('evt.methods.peaks_over_threshold.numexpr', numexpr_stub):
+                pot = PeaksOverThreshold(dataset, threshold=.5)
+            self.assertEqual(number_of_evaluations, numexpr_stub.number_of_evaluations)
+            self.assertTrue(np.array_equal(values > .5, pot.tail_mask))
+
+    def test_order_statistics(self):
+        series = pd.Series([3, 1, 4, 1, 5])
+        dataset = Dataset(series)
+        pot = PeaksOverThreshold(dataset, threshold=2)
+        self.assertTrue(np.all(np.isclose(
+            [5, 4, 3],
+            pot.order_statistics
+        )))
+        self.assertIs(pot.order_statistics, pot.order_statistics)
+
+    def test_empirical_survival(self):
+        series = pd.Series([3, 1, 4, 4, 5])
+        pot = PeaksOverThreshold(Dataset(series), threshold=2)
+        values, empirical_survival = pot.empirical_survival
+        self.assertTrue(np.all(np.isclose(
+            [3, 4, 5],
+            values
+        )))
+        self.assertTrue(np.all(np.isclose(
+            [.8, .6, .2],
+            empirical_survival
+        )))
+        self.assertIs(pot.empirical_survival, pot.empirical_survival)
+
     def test_raise_negative_threshold(self):
         series = pd.Series(range(10))
         dataset = Dataset(series)
@@ -85,3 +179,18 @@ class TestPeaksOverThreshold(unittest.TestCase):
             b'\x8c\xc1\xc5u\xe2!B\xe8\xfa\x19\x9d\xfb!\xa0\x0f\xce',
             hashed
         )
+
+    def test_plot_rasterize(self):
+        series = pd.Series(range(1, 10))
+        dataset = Dataset(series)
+        pot = PeaksOverThreshold(dataset, threshold=0)
+
+        for plot in [pot.plot_qq_exponential, pot.plot_zipf]:
+            fig = plt.figure(figsize=(8, 6))
+            ax = plt.gca()
+
+            out_file = io.StringIO()
+            plot(ax, rasterize=True)
+            fig.savefig(out_file, format='svg')
+            self.assertIn('<image', out_file.getvalue())
+            plt.close(fig)
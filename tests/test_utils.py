@@ -20,6 +20,44 @@ class TestUtils(unittest.TestCase):
             result.index
         )))
 
+    def test_presorted(self):
+        series = pd.Series([15, 14, 14, 13, 10, 16], index=list(range(20, 26)))
+        sorted_ascending = np.sort(series.values)
+        for function in [utils.empirical_cdf, utils.mean_excess, utils.order_statistics]:
+            expected = function(series)
+            result = function(series, sorted_ascending)
+            self.assertTrue(np.all(np.isclose(
+                expected.index,
+                result.index
+            )))
+            self.assertTrue(np.all(np.isclose(
+                expected.values,
+                result.values
+            )))
+
+    def test_empirical_cdf_arrays(self):
+        values, cdf = utils._empirical_cdf_arrays(np.array([13, 14, 14, 15]))
+        self.assertTrue(np.all(np.isclose(
+            [13, 14, 15],
+            values
+        )))
+        self.assertTrue(np.all(np.isclose(
+            [0.2, 0.4, 0.8],
+            cdf
+        )))
+
+    def test_thinning_indices(self):
+        self.assertTrue(np.all(np.arange(5) == utils._thinning_indices(5, 10)))
+        self.assertTrue(np.all(np.arange(5) == utils._thinning_indices(5, None)))
+        self.assertTrue(np.all([0, 3, 6, 9] == utils._thinning_indices(10, 4)))
+
+        indices = utils._thinning_indices(1000, 20, logarithmic=True)
+        self.assertLessEqual(len(indices), 20)
+        self.assertEqual(0, indices[0])
+        self.assertEqual(999, indices[-1])
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertGreater(indices[1] - indices[0], indices[-1] - indices[-2])
+
     def test_mean_excess(self):
         series = pd.Series([1, 2, 3, 3, 4], index=[10, 11, 12, 13, 14])
         mean_excess = utils.mean_excess(series)
@@ -48,6 +86,9 @@ class TestUtils(unittest.TestCase):
         (1.2, 0, '$1 $'),
         (12, 0, r'$1 \cdot 10^{1}$'),
         (120, 0, r'$1 \cdot 10^{2}$'),
+        (9.96, 1, r'$1.0 \cdot 10^{1}$'),
+        (1035, 2, r'$1.04 \cdot 10^{3}$'),
+        (-0.012, 1, r'$-1.2 \cdot 10^{-2}$'),
     ])
     def test_scientific_notation(
             self,
@@ -78,3 +119,4 @@ class TestUtils(unittest.TestCase):
     def test_confidence_interval_to_std(self, confidence, desired_result):
         result = utils.confidence_interval_to_std(confidence)
         self.assertAlmostEqual(desired_result, result)
+        self.assertIsInstance(result, float)